@@ -95,7 +95,7 @@ def create_material(
     else:
         properties["name"] = properties["name"].lower()
         for key in keys:
-            properties[key] = _np.float(properties[key])
+            properties[key] = float(properties[key])
         if save_to_file:
             _write_material_database(properties)
 
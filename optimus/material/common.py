@@ -1,6 +1,6 @@
 import numpy as _np
-import pandas as pd
 import os
+from functools import lru_cache as _lru_cache
 
 
 def get_excel_database(
@@ -9,7 +9,9 @@ def get_excel_database(
     header_format=(0, 1),
     index_col=None,
 ):
-    """Read excel database file as a pandas dataframe
+    """Read excel database file as a pandas dataframe.
+
+    The parsed file is cached for the session and a copy is returned.
 
     Parameters
     ----------
@@ -37,6 +39,35 @@ def get_excel_database(
     else:
         raise ValueError("undefined database.")
 
+    dataframe = _read_excel_database(
+        file_name, sheet_name, tuple(header_format), index_col
+    )
+    return dataframe.copy()
+
+
+@_lru_cache(maxsize=8)
+def _read_excel_database(file_name, sheet_name, header_format, index_col):
+    """Read an excel database file from the material directory and cache it.
+
+    Parameters
+    ----------
+    file_name: str
+        The name of the excel file.
+    sheet_name: str, int
+        The excel sheet to be loaded
+    header_format: tuple[int]
+        The header format of data table in the sheet
+    index_col : int, None
+        Column index for labels.
+
+    Returns
+    -------
+    dataframe: pandas.Dataframe
+        The database with material parameters.
+    """
+
+    import pandas as pd
+
     datadir = os.path.dirname(__file__)
     database_file = os.path.join(datadir, file_name)
     dataframe = pd.read_excel(
@@ -48,6 +79,59 @@ def get_excel_database(
     return dataframe
 
 
+@_lru_cache(maxsize=1)
+def _material_index():
+    """Build a lookup table of the materials in all databases and cache it.
+
+    When a material name appears in both databases, the default database
+    takes precedence.
+
+    Returns
+    -------
+    index : dict
+        A dictionary with the lowercase material names as keys and
+        dictionaries of material properties as values.
+    """
+
+    columns = [
+        ("Tissue", "Name"),
+        ("Density (kg/m3)", "Average"),
+        ("Speed of Sound (m/s)", "Average"),
+        ("Attenuation Constant", "a [Np/m/MHz]"),
+        ("Attenuation Constant", "b"),
+    ]
+    index = {}
+    for database in ("default", "user-defined"):
+        dataframe = get_excel_database(database=database)
+        for (
+            name,
+            density,
+            speed_of_sound,
+            attenuation_coeff_a,
+            attenuation_pow_b,
+        ) in zip(*(dataframe[column].to_numpy() for column in columns)):
+            if isinstance(name, str):
+                index.setdefault(
+                    name.lower(),
+                    {
+                        "name": name.lower(),
+                        "density": density,
+                        "speed_of_sound": speed_of_sound,
+                        "attenuation_coeff_a": attenuation_coeff_a,
+                        "attenuation_pow_b": attenuation_pow_b,
+                    },
+                )
+    return index
+
+
+def _clear_database_cache():
+    """Clear the cached material databases, for example after the
+    user-defined database has been modified."""
+
+    _read_excel_database.cache_clear()
+    _material_index.cache_clear()
+
+
 def get_material_properties(name):
     """Extract material properties from all databases.
 
@@ -69,31 +153,13 @@ def get_material_properties(name):
     else:
         name = name.lower()
 
-    dataframe_default = get_excel_database(database="default")
-    dataframe_user = get_excel_database(database="user-defined")
-    dataframe = pd.concat([dataframe_default, dataframe_user], axis=0, sort=False)
-
-    data_mask = dataframe[("Tissue", "Name")].str.lower().isin([name])
-    if not data_mask.any():
+    index = _material_index()
+    if name not in index:
         raise ValueError(
             "the material: " + bold_ul_red_text(name) + "is not in the database."
         )
     else:
-        material = dataframe.loc[data_mask]
-        density = material[("Density (kg/m3)", "Average")].get_values()[0]
-        speed_of_sound = material[("Speed of Sound (m/s)", "Average")].get_values()[0]
-        attenuation_coeff_a = material[
-            ("Attenuation Constant", "a [Np/m/MHz]")
-        ].get_values()[0]
-        attenuation_pow_b = material[("Attenuation Constant", "b")].get_values()[0]
-        output = {
-            "name": name,
-            "density": density,
-            "speed_of_sound": speed_of_sound,
-            "attenuation_coeff_a": attenuation_coeff_a,
-            "attenuation_pow_b": attenuation_pow_b,
-        }
-        return output
+        return dict(index[name])
 
 
 def write_material_database(properties):
@@ -110,18 +176,12 @@ def write_material_database(properties):
         None
     """
 
+    import pandas as pd
+
     user_database_file = "Material_database_user-defined.xlsx"
-    dataframe_default = get_excel_database(database="default")
-    dataframe_user = get_excel_database(
-        database="user-defined",
-        header_format=(0, 1),
-        index_col=0,
-    )
-    dataframe_both = pd.concat([dataframe_default, dataframe_user], axis=0, sort=False)
 
     name = properties["name"].lower()
-    data_mask = dataframe_both[("Tissue", "Name")].str.lower().isin([name])
-    if data_mask.any():
+    if name in _material_index():
         raise ValueError(
             "A material with the name: \033[1m"
             + name
@@ -156,13 +216,19 @@ def write_material_database(properties):
             columns=cols,
         )
 
+        dataframe_user = get_excel_database(
+            database="user-defined",
+            header_format=(0, 1),
+            index_col=0,
+        )
         datadir = os.path.dirname(__file__)
         database_file = os.path.join(datadir, user_database_file)
-        writer = pd.ExcelWriter(database_file, engine="xlsxwriter")
-        dataframe_user.append(dataframe_tmp, ignore_index=True, sort=False).to_excel(
-            writer, sheet_name="user-defined"
+        dataframe_new = pd.concat(
+            [dataframe_user, dataframe_tmp], ignore_index=True, sort=False
         )
-        writer.save()
+        with pd.ExcelWriter(database_file, engine="xlsxwriter") as writer:
+            dataframe_new.to_excel(writer, sheet_name="user-defined")
+        _clear_database_cache()
 
 
 class Material:
@@ -251,6 +317,8 @@ class Material:
             None
         """
 
+        import pandas as pd
+
         cols = [
             "name",
             "density",
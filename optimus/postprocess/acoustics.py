@@ -1461,6 +1461,9 @@ def compute_pressure_boundary(grid, boundary_points, dirichlet_solution):
     local_coords = _np.zeros((2, n), dtype=float)
     total_boundary_pressure = _np.zeros(n, dtype="complex128")
 
+    # Retrieve the grid entities once, instead of once per boundary point
+    grid_elements = list(grid.leaf_view.entity_iterator(0))
+
     # Loop over elements within which near points lie
     for i in range(n):
         # Obtain vertices of element
@@ -1525,7 +1528,7 @@ def compute_pressure_boundary(grid, boundary_points, dirichlet_solution):
         local_coords[:, i] = _np.matmul(transformation_matrix_inv, rhs).transpose()
 
         # Required format for element and local coordinates for GridFunction.evaluate
-        elem = list(grid.leaf_view.entity_iterator(0))[element_index[i]]
+        elem = grid_elements[element_index[i]]
         coord = _np.array([[local_coords[0, i]], [local_coords[1, i]]])
 
         # Calculate pressure phase and magnitude at near point
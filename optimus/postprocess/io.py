@@ -3,7 +3,7 @@ def export_to_file(
     post_process,
     global_parameters,
     file_name="optimus_exported_data",
-    file_format="db",
+    file_format="pkl",
 ):
     """Export the simulation results into a file.
 
@@ -19,47 +19,57 @@ def export_to_file(
         The export path and the file name in one string.
     file_format : str
         'mat': to save ONLY the post_process results into a MATLAB file.
-        'db': (default) to save all the attributes of global parameters,
-        source parameters, post processor and pickable objects of the model.
+        'pkl': (default) to save all the attributes of global parameters,
+        source parameters, post processor and pickable objects of the model
+        into a pickle file with the extension 'pkl'.
+        'db': an alias of 'pkl', kept for backward compatibility.
 
     """
-    import shelve as _shelve
+    import pickle as _pickle
     import copy as _copy
 
-    model_copy = _copy.deepcopy(model)
+    # Shallow copies are sufficient to remove the unpicklable attributes,
+    # without copying the data shared with the original objects.
+    model_copy = _copy.copy(model)
     delattr(model_copy, "continous_operator")
     delattr(model_copy, "discrete_operator")
     delattr(model_copy, "discrete_preconditioner")
     delattr(model_copy, "lhs_discrete_system")
 
-    postprocess_copy = _copy.deepcopy(post_process)
+    postprocess_copy = _copy.copy(post_process)
     delattr(postprocess_copy, "model")
+    postprocess_copy.field = _copy.copy(post_process.field)
     delattr(postprocess_copy.field, "model")
 
     if file_format.lower() == "mat":
+        import numpy as _np
         import scipy.io as _sio
 
         _sio.savemat(
             file_name + ".mat",
             {
-                "total_field": post_process.total_field,
-                "scattered_field": post_process.scattered_field,
-                "incident_field": post_process.incident_field,
+                "total_field": _np.ascontiguousarray(post_process.total_field),
+                "scattered_field": _np.ascontiguousarray(post_process.scattered_field),
+                "incident_field": _np.ascontiguousarray(post_process.incident_field),
                 "L2_norm_ptot_MPa": post_process.l2_norm_total_field_mpa,
                 "gmres_iter_count": model.iteration_count,
-                "points": post_process.points,
+                "points": _np.ascontiguousarray(post_process.points),
             },
+            format="5",
+            do_compression=True,
         )
         print("The data are written to the file:", file_name + file_format)
     else:
-        db_handle = _shelve.open(file_name)
-        db_handle["global_parameters"] = global_parameters
-        db_handle["source"] = model_copy.source
-        db_handle["model"] = model_copy
-        db_handle["post_process"] = postprocess_copy
-        print("The data are written to the file:", file_name + "." + file_format)
-        print("The list of keys are:", list(db_handle.keys()))
-        db_handle.close()
+        exported_data = {
+            "global_parameters": global_parameters,
+            "source": model_copy.source,
+            "model": model_copy,
+            "post_process": postprocess_copy,
+        }
+        with open(file_name + ".pkl", "wb") as file_handle:
+            _pickle.dump(exported_data, file_handle, protocol=_pickle.HIGHEST_PROTOCOL)
+        print("The data are written to the file:", file_name + ".pkl")
+        print("The list of keys are:", list(exported_data.keys()))
 
 
 def import_from_file(file_name):
@@ -69,7 +79,8 @@ def import_from_file(file_name):
     ----------
     file_name : str
         This string includes the file name (with path) and the file extension
-        in one string. The supported extensions are 'mat' and 'db'.
+        in one string. The supported extensions are 'mat', 'pkl' and 'db'.
+        The 'db' extension is for shelve files exported by earlier versions.
 
     Returns
     -------
@@ -79,16 +90,25 @@ def import_from_file(file_name):
     """
 
     import os
-    import scipy.io as _sio
-    import shelve as _shelve
 
     file_format = os.path.splitext(file_name)[1]
-    if not file_format.lower() in [".mat", ".db"]:
-        raise TypeError("The file format is unknown, pass a DB or MAT file to import.")
+    if not file_format.lower() in [".mat", ".pkl", ".db"]:
+        raise TypeError(
+            "The file format is unknown, pass a PKL, DB or MAT file to import."
+        )
     elif file_format.lower() == ".mat":
+        import scipy.io as _sio
+
         imported_data = _sio.loadmat(file_name)
+    elif file_format.lower() == ".pkl":
+        import pickle as _pickle
+
+        with open(file_name, "rb") as file_handle:
+            imported_data = _pickle.load(file_handle)
     else:
-        db_handle = _shelve.open(os.path.splitext(file_name)[0])
+        import shelve as _shelve
+
+        db_handle = _shelve.open(os.path.splitext(file_name)[0], flag="r")
         imported_data = {key: db_handle[key] for key in list(db_handle.keys())}
         db_handle.close()
 
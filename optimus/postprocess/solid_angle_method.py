@@ -1,9 +1,12 @@
 """The solid angle method for exterior-interior point evaluation."""
 
 import numpy as _np
-from functools import partial as _partial
+from numba import njit as _njit
+from numba import prange as _prange
 import time as _time
-import multiprocessing as _mp
+import weakref as _weakref
+
+_grid_geometry_cache = _weakref.WeakKeyDictionary()
 
 
 def exterior_interior_points_eval(grid, points, solid_angle_tolerance, verbose=False):
@@ -45,75 +48,41 @@ def exterior_interior_points_eval(grid, points, solid_angle_tolerance, verbose=F
         The list has elements for each geometrical tag in the mesh.
     """
 
-    elements = grid.leaf_view.elements
-    vertices = grid.leaf_view.vertices
-    number_of_elements = grid.leaf_view.entity_count(0)
-
     points_interior = []
     points_exterior = []
     points_boundary = []
     index_interior = []
     index_exterior = _np.full(points.shape[1], True, dtype=bool)
     index_boundary = []
-    
-    elements_x_coordinate = _np.zeros(shape=(3, number_of_elements), dtype=float)
-    elements_y_coordinate = _np.zeros(shape=(3, number_of_elements), dtype=float)
-    elements_z_coordinate = _np.zeros(shape=(3, number_of_elements), dtype=float)
-    # Populate grid vertices matrices
-    for k in range(3):
-        elements_x_coordinate[k, :] = vertices[0, elements[k, :]]
-        elements_y_coordinate[k, :] = vertices[1, elements[k, :]]
-        elements_z_coordinate[k, :] = vertices[2, elements[k, :]]
-    # Obtain coordinates of triangular elements centroielements_surface_area
-    # through barycentric method.
-    elements_barycent_x_coordinate = _np.mean(elements_x_coordinate, axis=0)
-    elements_barycent_y_coordinate = _np.mean(elements_y_coordinate, axis=0)
-    elements_barycent_z_coordinate = _np.mean(elements_z_coordinate, axis=0)
 
-    # Compute matrix of vectors defining each triangular elements
-    elements_u_coordinate = _np.array(
-        [
-            elements_x_coordinate[1, :] - elements_x_coordinate[0, :],
-            elements_y_coordinate[1, :] - elements_y_coordinate[0, :],
-            elements_z_coordinate[1, :] - elements_z_coordinate[0, :],
-        ]
-    )
-    elements_v_coordinate = _np.array(
-        [
-            elements_x_coordinate[2, :] - elements_x_coordinate[0, :],
-            elements_y_coordinate[2, :] - elements_y_coordinate[0, :],
-            elements_z_coordinate[2, :] - elements_z_coordinate[0, :],
-        ]
-    )
-    elements_u_cross_v = _np.cross(
-        elements_u_coordinate, elements_v_coordinate, axisa=0, axisb=0, axisc=0
+    (
+        elements_barycent,
+        normals,
+        elements_surface_area,
+        bounding_box_min,
+        bounding_box_max,
+    ) = _grid_geometry(grid)
+
+    # Only field points inside the bounding box of the grid can be interior or
+    # boundary points. The solid angle of all other points is zero.
+    index_bounding_box = _np.all(
+        (points >= bounding_box_min[:, None]) & (points <= bounding_box_max[:, None]),
+        axis=0,
     )
-    elements_u_cross_v_norm = _np.linalg.norm(elements_u_cross_v, axis=0)
-    # Obtain outward pointing unit normal vectors for each elements
-    normals = _np.divide(elements_u_cross_v, elements_u_cross_v_norm)
-    # Obtain surface area of each elements
-    elements_surface_area = 0.5 * elements_u_cross_v_norm
-    
+
     start_time = _time.time()
-    N_workers = _mp.cpu_count()
-    parallelised_compute_solid_angle = _partial(
-        compute_solid_angle,
-        elements_barycent_x_coordinate,
-        elements_barycent_y_coordinate,
-        elements_barycent_z_coordinate,
-        points,
+    solid_angle = _np.zeros(points.shape[1], dtype=float)
+    solid_angle[index_bounding_box] = compute_solid_angle_numba(
+        elements_barycent[0],
+        elements_barycent[1],
+        elements_barycent[2],
+        points[:, index_bounding_box],
         normals,
         elements_surface_area,
     )
-    pool = _mp.Pool(N_workers)
-    result = pool.starmap(
-        parallelised_compute_solid_angle, zip(_np.arange(0, points.shape[1]))
-    )
-    pool.close()
     end_time = _time.time() - start_time
     if verbose:
-        print("Time to complete solid angle field parallelisation: ", end_time)
-    solid_angle = _np.hstack(result)
+        print("Time to complete solid angle field calculation: ", end_time)
     if solid_angle_tolerance:
         index_interior_tmp = solid_angle > 0.5 + solid_angle_tolerance
         index_boundary_tmp = (solid_angle > 0.5 - solid_angle_tolerance) & (
@@ -143,56 +112,127 @@ def exterior_interior_points_eval(grid, points, solid_angle_tolerance, verbose=F
     )
 
 
-def compute_solid_angle(
+def _grid_geometry(grid):
+    """Compute the geometric quantities of the triangular elements of a grid
+    needed by the solid angle method. The results are cached for each grid.
+
+    Parameters
+    ----------
+    grid : bempp.api.Grid
+        surface grid defining a domain
+
+    Returns
+    -------
+    elements_barycent : numpy.ndarray
+        Array of size (3,N_elements) with the barycenters of the elements.
+    normals : numpy.ndarray
+        Array of size (3,N_elements) with the unit normals of the elements.
+    elements_surface_area : numpy.ndarray
+        Array of size (N_elements,) with the surface areas of the elements.
+    bounding_box_min : numpy.ndarray
+        Array of size (3,) with the lower corner of the padded bounding box.
+    bounding_box_max : numpy.ndarray
+        Array of size (3,) with the upper corner of the padded bounding box.
+    """
+
+    if grid in _grid_geometry_cache:
+        return _grid_geometry_cache[grid]
+
+    elements = grid.leaf_view.elements
+    vertices = grid.leaf_view.vertices
+
+    # Gather the vertex coordinates of all triangular elements at once,
+    # in an array of size (3, 3, N_elements) with axes (coordinate, vertex, element).
+    elements_vertices = vertices[:, elements]
+    # Obtain coordinates of triangular elements centroids
+    # through barycentric method.
+    elements_barycent = elements_vertices.mean(axis=1)
+
+    # Compute matrix of vectors defining each triangular elements
+    elements_u_coordinate = elements_vertices[:, 1, :] - elements_vertices[:, 0, :]
+    elements_v_coordinate = elements_vertices[:, 2, :] - elements_vertices[:, 0, :]
+    elements_u_cross_v = _np.cross(
+        elements_u_coordinate, elements_v_coordinate, axisa=0, axisb=0, axisc=0
+    )
+    elements_u_cross_v_norm = _np.linalg.norm(elements_u_cross_v, axis=0)
+    # Obtain outward pointing unit normal vectors for each elements
+    normals = _np.divide(elements_u_cross_v, elements_u_cross_v_norm)
+    # Obtain surface area of each elements
+    elements_surface_area = 0.5 * elements_u_cross_v_norm
+
+    # The bounding box is padded with the largest element edge, so that field
+    # points close to the surface are still evaluated.
+    bounding_box_padding = max(
+        _np.linalg.norm(elements_u_coordinate, axis=0).max(),
+        _np.linalg.norm(elements_v_coordinate, axis=0).max(),
+        _np.linalg.norm(elements_v_coordinate - elements_u_coordinate, axis=0).max(),
+    )
+    bounding_box_min = elements_vertices.min(axis=(1, 2)) - bounding_box_padding
+    bounding_box_max = elements_vertices.max(axis=(1, 2)) + bounding_box_padding
+
+    geometry = (
+        elements_barycent,
+        normals,
+        elements_surface_area,
+        bounding_box_min,
+        bounding_box_max,
+    )
+    _grid_geometry_cache[grid] = geometry
+    return geometry
+
+
+@_njit(parallel=True, fastmath=True, cache=True)
+def compute_solid_angle_numba(
     elements_barycent_x_coordinate,
     elements_barycent_y_coordinate,
     elements_barycent_z_coordinate,
     points,
     normals,
     elements_surface_area,
-    point_index,
 ):
-    """Compute the solid angle value for a triangular element.
+    """Compute the solid angle subtended by a triangular surface grid at the
+    field points. Use Numba for acceleration and parallelisation.
 
     Parameters
     ----------
     elements_barycent_x_coordinate : numpy.ndarray
-
+        Array of size (N_elements,) with the x-coordinates of the barycenters.
     elements_barycent_y_coordinate : numpy.ndarray
-
+        Array of size (N_elements,) with the y-coordinates of the barycenters.
     elements_barycent_z_coordinate : numpy.ndarray
-
+        Array of size (N_elements,) with the z-coordinates of the barycenters.
     points : numpy.ndarray
-
+        Array of size (3,N) with the coordinates of the field points.
     normals : numpy.ndarray
-
+        Array of size (3,N_elements) with the unit normals of the elements.
     elements_surface_area : numpy.ndarray
-
-    point_index : numpy.ndarray
+        Array of size (N_elements,) with the surface areas of the elements.
 
     Returns
     -------
     solid_angle : numpy.ndarray
-
+        Array of size (N,) with the solid angle values, normalised by 4*pi.
     """
 
-    elements_barycen_dist = _np.array(
-        [
-            elements_barycent_x_coordinate - points[0, point_index],
-            elements_barycent_y_coordinate - points[1, point_index],
-            elements_barycent_z_coordinate - points[2, point_index],
-        ]
-    )
-    elements_barycen_dist_norm = _np.linalg.norm(elements_barycen_dist, axis=0)
-    elements_barycen_dist_normalised = _np.divide(
-        elements_barycen_dist, elements_barycen_dist_norm
-    )
-    elements_barycen_dist_projected = _np.sum(
-        elements_barycen_dist_normalised * normals, axis=0
-    )
-    solid_angle = _np.sum(
-        elements_barycen_dist_projected
-        * elements_surface_area
-        / elements_barycen_dist_norm**2
-    ) / (4 * _np.pi)
-    return solid_angle
\ No newline at end of file
+    number_of_points = points.shape[1]
+    number_of_elements = elements_surface_area.shape[0]
+    solid_angle = _np.empty(number_of_points, dtype=_np.float64)
+
+    for i in _prange(number_of_points):
+        temp_solid_angle = 0.0
+        for j in range(number_of_elements):
+            dist_x = elements_barycent_x_coordinate[j] - points[0, i]
+            dist_y = elements_barycent_y_coordinate[j] - points[1, i]
+            dist_z = elements_barycent_z_coordinate[j] - points[2, i]
+            dist_norm_sq = dist_x * dist_x + dist_y * dist_y + dist_z * dist_z
+            dist_projected = (
+                dist_x * normals[0, j] + dist_y * normals[1, j] + dist_z * normals[2, j]
+            )
+            temp_solid_angle += (
+                dist_projected
+                * elements_surface_area[j]
+                / (dist_norm_sq * _np.sqrt(dist_norm_sq))
+            )
+        solid_angle[i] = temp_solid_angle / (4 * _np.pi)
+
+    return solid_angle
@@ -191,9 +191,12 @@ def domain_edge(grids, plane_axes, plane_offset):
         vertices = grid.leaf_view.vertices
         elements = grid.leaf_view.elements
 
-        axis_0_patch = vertices[axis_0, elements]
-        axis_1_patch = vertices[axis_1, elements]
-        axis_2_patch = vertices[axis_2, elements]
+        # Gather the vertex coordinates of all elements at once, in an array
+        # of size (3, 3, N_elements) with axes (coordinate, vertex, element).
+        elements_vertices = vertices[:, elements]
+        axis_0_patch = elements_vertices[axis_0]
+        axis_1_patch = elements_vertices[axis_1]
+        axis_2_patch = elements_vertices[axis_2[0]]
 
         axis_0_intersect = list()
         axis_1_intersect = list()
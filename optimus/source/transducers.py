@@ -822,8 +822,8 @@ def calc_field_from_point_sources(
             pressure_result = _np.stack([r[0] for r in result])
             gradient_result = _np.stack([r[1] for r in result], axis=2)
 
-            pressure = pressure_result.sum(axis=0, dtype=_np.complex)
-            gradient = gradient_result.sum(axis=2, dtype=_np.complex)
+            pressure = pressure_result.sum(axis=0, dtype=_np.complex128)
+            gradient = gradient_result.sum(axis=2, dtype=_np.complex128)
         else:
             result_as_array = _np.asarray(result)
 
@@ -885,8 +885,8 @@ def calc_field_from_point_sources(
         _np.copyto(source_weights_imag_np, source_weights.imag, casting="no")
 
         # Output arrays:
-        pressure = _np.zeros(locations_observation.shape[1], dtype=_np.complex)
-        gradient = _np.zeros((3, locations_observation.shape[1]), dtype=_np.complex)
+        pressure = _np.zeros(locations_observation.shape[1], dtype=_np.complex128)
+        gradient = _np.zeros((3, locations_observation.shape[1]), dtype=_np.complex128)
         pressure_shape = pressure.shape
         gradient_shape = gradient.shape
         pressure_real_buffer = _mp.Array("d", pressure_shape[0])
@@ -1142,8 +1142,8 @@ def calc_field_from_point_sources_mp_source_para(
         pressure field in the observation points.
     """
 
-    pressure = _np.empty(number_of_observation_locations, dtype=_np.complex)
-    gradient = _np.empty((3, number_of_observation_locations), dtype=_np.complex)
+    pressure = _np.empty(number_of_observation_locations, dtype=_np.complex128)
+    gradient = _np.empty((3, number_of_observation_locations), dtype=_np.complex128)
 
     i1, i2 = chunks_index_source[parallelisation_index : parallelisation_index + 2]
 
@@ -1217,8 +1217,8 @@ def calc_field_from_point_sources_mp_source_para_shared(
     source_weights_np.real = source_weights_real_np
     source_weights_np.imag = source_weights_imag_np
 
-    pressure = _np.empty(number_of_observation_locations, dtype=_np.complex)
-    gradient = _np.empty((3, number_of_observation_locations), dtype=_np.complex)
+    pressure = _np.empty(number_of_observation_locations, dtype=_np.complex128)
+    gradient = _np.empty((3, number_of_observation_locations), dtype=_np.complex128)
 
     i1, i2 = chunks_index_source[parallelisation_index : parallelisation_index + 2]
 
@@ -1310,10 +1310,10 @@ def calc_field_from_point_sources_mp_field_para(
     j1, j2 = chunks_index_field[parallelisation_index : parallelisation_index + 2]
 
     pressure_tmp = _np.ndarray(
-        shape=(j2 - j1, len(chunks_index_source) - 1), dtype=_np.complex
+        shape=(j2 - j1, len(chunks_index_source) - 1), dtype=_np.complex128
     )
     gradient_tmp = _np.ndarray(
-        shape=(3, j2 - j1, len(chunks_index_source) - 1), dtype=_np.complex
+        shape=(3, j2 - j1, len(chunks_index_source) - 1), dtype=_np.complex128
     )
 
     for i in range(len(chunks_index_source) - 1):
@@ -1331,8 +1331,8 @@ def calc_field_from_point_sources_mp_field_para(
             source_weights[i1:i2],
         )
 
-    pressure = pressure_tmp.sum(axis=1, dtype=_np.complex)
-    gradient = gradient_tmp.sum(axis=2, dtype=_np.complex)
+    pressure = pressure_tmp.sum(axis=1, dtype=_np.complex128)
+    gradient = gradient_tmp.sum(axis=2, dtype=_np.complex128)
 
     return pressure, gradient
 
@@ -1389,10 +1389,10 @@ def calc_field_from_point_sources_mp_field_para_shared(
     j1, j2 = chunks_index_field[parallelisation_index : parallelisation_index + 2]
 
     pressure_tmp = _np.ndarray(
-        shape=(j2 - j1, len(chunks_index_source) - 1), dtype=_np.complex
+        shape=(j2 - j1, len(chunks_index_source) - 1), dtype=_np.complex128
     )
     gradient_tmp = _np.ndarray(
-        shape=(3, j2 - j1, len(chunks_index_source) - 1), dtype=_np.complex
+        shape=(3, j2 - j1, len(chunks_index_source) - 1), dtype=_np.complex128
     )
 
     for i in range(len(chunks_index_source) - 1):
@@ -1410,8 +1410,8 @@ def calc_field_from_point_sources_mp_field_para_shared(
             source_weights_np[i1:i2],
         )
 
-    pressure = pressure_tmp.sum(axis=1, dtype=_np.complex)
-    gradient = gradient_tmp.sum(axis=2, dtype=_np.complex)
+    pressure = pressure_tmp.sum(axis=1, dtype=_np.complex128)
+    gradient = gradient_tmp.sum(axis=2, dtype=_np.complex128)
 
     pressure_real_np = _np.frombuffer(
         workers_dict["pressure_real_buffer"].get_obj(), dtype=_np.float64
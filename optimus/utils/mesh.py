@@ -3,7 +3,86 @@
 import bempp.api as _bempp
 from ..geometry.common import Geometry as _Geometry
 from .conversions import convert_to_float as _convert_to_float
+from .conversions import convert_to_array as _convert_to_array
 import numpy as _np
+from functools import lru_cache as _lru_cache
+from numba import njit as _njit
+from numba import prange as _prange
+import os as _os
+import subprocess as _subprocess
+import sys as _sys
+import tempfile as _tempfile
+
+
+def _fast_median(values):
+    """Compute the median of a one-dimensional array by partitioning it in place.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The values, which are reordered by this function.
+
+    Returns
+    -------
+    median : float
+        The median of the values.
+    """
+
+    half = values.size // 2
+    if values.size % 2:
+        values.partition(half)
+        return values[half]
+    else:
+        values.partition((half - 1, half))
+        return 0.5 * (values[half - 1] + values[half])
+
+
+@_njit(parallel=True, fastmath=True, cache=True)
+def _mesh_stats_kernel(vertices, elements):
+    """Compute the edge lengths of all triangular elements and their minimum,
+    maximum and sum in a single pass. Use Numba for acceleration and
+    parallelisation.
+
+    Parameters
+    ----------
+    vertices : numpy.ndarray
+        An array of size (3,N_vertices) with the coordinates of the vertices.
+    elements : numpy.ndarray
+        An array of size (3,N_elements) with the vertex indices of the elements.
+
+    Returns
+    -------
+    element_size : numpy.ndarray
+        An array of size (3,N_elements) with the edge lengths of the elements.
+    elements_min : float
+        The minimum edge length.
+    elements_max : float
+        The maximum edge length.
+    elements_sum : float
+        The sum of all edge lengths.
+    """
+
+    number_of_elements = elements.shape[1]
+    element_size = _np.empty((3, number_of_elements), dtype=_np.float64)
+    # A finite start value, since fastmath lets the compiler assume no infinities.
+    elements_min = _np.finfo(_np.float64).max
+    elements_max = 0.0
+    elements_sum = 0.0
+
+    for i in _prange(number_of_elements):
+        for k in range(3):
+            corner_start = elements[k, i]
+            corner_end = elements[(k + 1) % 3, i]
+            dist_x = vertices[0, corner_end] - vertices[0, corner_start]
+            dist_y = vertices[1, corner_end] - vertices[1, corner_start]
+            dist_z = vertices[2, corner_end] - vertices[2, corner_start]
+            edge_length = _np.sqrt(dist_x * dist_x + dist_y * dist_y + dist_z * dist_z)
+            element_size[k, i] = edge_length
+            elements_min = min(elements_min, edge_length)
+            elements_max = max(elements_max, edge_length)
+            elements_sum += edge_length
+
+    return element_size, elements_min, elements_max, elements_sum
 
 
 def _get_mesh_stats(grid, verbose=False):
@@ -23,25 +102,23 @@ def _get_mesh_stats(grid, verbose=False):
         The mesh statistics.
     """
 
-    elements = list(grid.leaf_view.entity_iterator(0))
-    element_size = [
-        _np.sqrt(
-            (
-                (
-                    element.geometry.corners
-                    - _np.roll(element.geometry.corners, 1, axis=1)
-                )
-                ** 2
-            ).sum(axis=0)
-        )
-        for element in elements
-    ]
-    elements_min = _np.min(element_size)
-    elements_max = _np.max(element_size)
-    elements_avg = _np.mean(element_size)
-    elements_med = _np.median(element_size)
-    elements_std = _np.std(element_size)
-    number_of_nodes = grid.leaf_view.entity_count(2)
+    leaf_view = grid.leaf_view
+    (
+        element_size,
+        elements_min,
+        elements_max,
+        elements_sum,
+    ) = _mesh_stats_kernel(leaf_view.vertices, leaf_view.elements)
+    element_size = element_size.ravel()
+
+    # The standard deviation reuses the mean instead of recomputing it.
+    elements_avg = elements_sum / element_size.size
+    element_size_deviation = element_size - elements_avg
+    elements_std = _np.sqrt(
+        _np.dot(element_size_deviation, element_size_deviation) / element_size.size
+    )
+    elements_med = _fast_median(element_size)
+    number_of_nodes = leaf_view.entity_count(2)
 
     if verbose:
         print("\n", 70 * "*")
@@ -83,24 +160,24 @@ def get_geometries_stats(geometries, verbose=False):
     """
 
     if isinstance(geometries, (list, tuple)):
-        labels = []
-        elements_min = []
-        elements_max = []
-        elements_avg = []
-        elements_med = []
-        elements_std = []
-        number_of_nodes = []
-
-        for geometry in geometries:
-            labels.append(geometry.label)
+        number_of_geometries = len(geometries)
+        labels = [geometry.label for geometry in geometries]
+        elements_min = _np.empty(number_of_geometries, dtype=float)
+        elements_max = _np.empty(number_of_geometries, dtype=float)
+        elements_avg = _np.empty(number_of_geometries, dtype=float)
+        elements_med = _np.empty(number_of_geometries, dtype=float)
+        elements_std = _np.empty(number_of_geometries, dtype=float)
+        number_of_nodes = _np.empty(number_of_geometries, dtype=int)
+
+        for i, geometry in enumerate(geometries):
             stats = _get_mesh_stats(geometry.grid, verbose=False)
-            elements_min.append(stats["elements_min"])
-            elements_max.append(stats["elements_max"])
-            elements_avg.append(stats["elements_avg"])
-            elements_med.append(stats["elements_med"])
-            elements_std.append(stats["elements_std"])
-            number_of_nodes.append(stats["number_of_nodes"])
-        total_number_of_nodes = _np.sum(number_of_nodes)
+            elements_min[i] = stats["elements_min"]
+            elements_max[i] = stats["elements_max"]
+            elements_avg[i] = stats["elements_avg"]
+            elements_med[i] = stats["elements_med"]
+            elements_std[i] = stats["elements_std"]
+            number_of_nodes[i] = stats["number_of_nodes"]
+        total_number_of_nodes = number_of_nodes.sum()
 
         stats_total = {
             "label": labels,
@@ -147,6 +224,31 @@ def get_geometries_stats(geometries, verbose=False):
     return stats_total
 
 
+def _clone_grid_with_new_vertices(grid, new_vertices):
+    """Create a grid with the connectivity and domain indices of an existing
+    grid, but with new vertex coordinates.
+
+    Parameters
+    ----------
+    grid : bempp.api.Grid
+        The grid whose elements and domain indices are reused.
+    new_vertices : numpy.ndarray
+        An array of size (3,N_vertices) with the new vertex coordinates.
+
+    Returns
+    -------
+    grid : bempp.api.Grid
+        The new grid.
+    """
+
+    leaf_view = grid.leaf_view
+    return _bempp.grid_from_element_data(
+        new_vertices,
+        leaf_view.elements,
+        leaf_view.domain_indices,
+    )
+
+
 def scale_mesh(geometry, scaling_factor):
     """Scale the entire geometry with a multiplicative factor.
 
@@ -167,12 +269,12 @@ def scale_mesh(geometry, scaling_factor):
     """
 
     scaling = _convert_to_float(scaling_factor, "mesh scaling factor")
-    new_vertices = geometry.grid.leaf_view.vertices * scaling
-    new_grid = _bempp.grid_from_element_data(
-        new_vertices,
-        geometry.grid.leaf_view.elements,
-        geometry.grid.leaf_view.domain_indices,
-    )
+    if scaling == 1.0:
+        return _Geometry(geometry.grid, label=geometry.label + "_scaled")
+
+    leaf_view = geometry.grid.leaf_view
+    new_vertices = _np.multiply(leaf_view.vertices, scaling)
+    new_grid = _clone_grid_with_new_vertices(geometry.grid, new_vertices)
     return _Geometry(new_grid, label=geometry.label + "_scaled")
 
 
@@ -194,18 +296,53 @@ def translate_mesh(geometry, translation_vector):
     geometry: optimus.geometry.common.Geometry
         A new, translated geometry.
     """
-    from ..utils.conversions import convert_to_array
-
-    translation = convert_to_array(translation_vector, (3, 1), "translation vector")
-    new_vertices = geometry.grid.leaf_view.vertices + translation
-    new_grid = _bempp.grid.grid_from_element_data(
-        new_vertices,
-        geometry.grid.leaf_view.elements,
-        geometry.grid.leaf_view.domain_indices,
-    )
+    translation = _convert_to_array(translation_vector, (3, 1), "translation vector")
+    leaf_view = geometry.grid.leaf_view
+    new_vertices = leaf_view.vertices + translation
+    new_grid = _clone_grid_with_new_vertices(geometry.grid, new_vertices)
     return _Geometry(new_grid, label=geometry.label + "_translated")
 
 
+@_lru_cache(maxsize=64)
+def _rotation_matrix(alpha, beta, gamma):
+    """Compute the matrix of a rotation around the x, y and z axes.
+
+    The matrices are cached for repeated angles and are read-only.
+
+    Parameters
+    ----------
+    alpha : float
+        The rotation angle around the x-axis.
+    beta : float
+        The rotation angle around the y-axis.
+    gamma : float
+        The rotation angle around the z-axis.
+
+    Returns
+    -------
+    rotation_matrix : numpy.ndarray
+        The (3,3) rotation matrix.
+    """
+
+    cos_alpha, sin_alpha = _np.cos(alpha), _np.sin(alpha)
+    cos_beta, sin_beta = _np.cos(beta), _np.sin(beta)
+    cos_gamma, sin_gamma = _np.cos(gamma), _np.sin(gamma)
+
+    # The combined rotation matrix R = R_z @ R_y @ R_x, written out explicitly.
+    rotation_matrix = _np.empty((3, 3), dtype=float)
+    rotation_matrix[0, 0] = cos_gamma * cos_beta
+    rotation_matrix[0, 1] = cos_gamma * sin_beta * sin_alpha - sin_gamma * cos_alpha
+    rotation_matrix[0, 2] = cos_gamma * sin_beta * cos_alpha + sin_gamma * sin_alpha
+    rotation_matrix[1, 0] = sin_gamma * cos_beta
+    rotation_matrix[1, 1] = sin_gamma * sin_beta * sin_alpha + cos_gamma * cos_alpha
+    rotation_matrix[1, 2] = sin_gamma * sin_beta * cos_alpha - cos_gamma * sin_alpha
+    rotation_matrix[2, 0] = -sin_beta
+    rotation_matrix[2, 1] = cos_beta * sin_alpha
+    rotation_matrix[2, 2] = cos_beta * cos_alpha
+    rotation_matrix.flags.writeable = False
+    return rotation_matrix
+
+
 def rotate_mesh(geometry, rotation_angles):
     """
     Rotate the entire geometry by the rotation angles.
@@ -231,39 +368,13 @@ def rotate_mesh(geometry, rotation_angles):
             "the three rotation angles (x,y,z)"
         )
 
-    alpha, beta, gamma = rotation_angles
-    rotation_matrix_x = _np.array(
-        [
-            [1, 0, 0],
-            [0, _np.cos(alpha), -_np.sin(alpha)],
-            [0, _np.sin(alpha), _np.cos(alpha)],
-        ]
-    )
-    rotation_matrix_y = _np.array(
-        [
-            [_np.cos(beta), 0, _np.sin(beta)],
-            [0, 1, 0],
-            [-_np.sin(beta), 0, _np.cos(beta)],
-        ]
-    )
-    rotation_matrix_z = _np.array(
-        [
-            [_np.cos(gamma), -_np.sin(gamma), 0],
-            [_np.sin(gamma), _np.cos(gamma), 0],
-            [0, 0, 1],
-        ]
-    )
+    rotation_matrix = _rotation_matrix(*(float(angle) for angle in rotation_angles))
 
-    old_vertices = geometry.grid.leaf_view.vertices
-    new_vertices = (
-        rotation_matrix_z @ rotation_matrix_y @ rotation_matrix_x @ old_vertices
-    )
+    leaf_view = geometry.grid.leaf_view
+    old_vertices = _np.ascontiguousarray(leaf_view.vertices)
+    new_vertices = _np.matmul(rotation_matrix, old_vertices)
 
-    new_grid = _bempp.grid.grid_from_element_data(
-        new_vertices,
-        geometry.grid.leaf_view.elements,
-        geometry.grid.leaf_view.domain_indices,
-    )
+    new_grid = _clone_grid_with_new_vertices(geometry.grid, new_vertices)
     return _Geometry(new_grid, label=geometry.label + "_rotated")
 
 
@@ -285,59 +396,61 @@ def rotate_mesh_around_center(geometry, rotation_angles):
     geometry: optimus.geometry.common.Geometry
         A new, rotated geometry.
     """
-    origin = [
-        (geometry.grid.bounding_box[0][0] + geometry.grid.bounding_box[1][0]) / 2,
-        (geometry.grid.bounding_box[0][1] + geometry.grid.bounding_box[1][1]) / 2,
-        (geometry.grid.bounding_box[0][2] + geometry.grid.bounding_box[1][2]) / 2,
-    ]
-    first_translation = translate_mesh(geometry, [-x for x in origin])
-    rotation = rotate_mesh(first_translation, rotation_angles)
-    new_geometry = translate_mesh(rotation, origin)
-    new_geometry.label = new_geometry.label[:-29] + "rotated_around_center"
 
-    return new_geometry
+    if len(rotation_angles) != 3:
+        raise ValueError(
+            "The input angles must be a list of three floats, "
+            "the three rotation angles (x,y,z)"
+        )
+
+    bounding_box = geometry.grid.bounding_box
+    origin = 0.5 * (_np.asarray(bounding_box[0]) + _np.asarray(bounding_box[1]))
+    origin = origin.reshape(3, 1)
+    rotation_matrix = _rotation_matrix(*(float(angle) for angle in rotation_angles))
+
+    # Translate the center to the origin, rotate, and translate back,
+    # in a single affine transformation: R (V - c) + c = R V + (c - R c).
+    leaf_view = geometry.grid.leaf_view
+    old_vertices = _np.ascontiguousarray(leaf_view.vertices)
+    new_vertices = _np.matmul(rotation_matrix, old_vertices)
+    new_vertices += origin - rotation_matrix @ origin
+
+    new_grid = _clone_grid_with_new_vertices(geometry.grid, new_vertices)
+    return _Geometry(new_grid, label=geometry.label + "_rotated_around_center")
 
 
 def msh_from_string(geo_string):
     """Create a mesh from a string."""
 
-    import os
-    import subprocess
-
     gmsh_command = _bempp.GMSH_PATH
     if gmsh_command is None:
         raise RuntimeError("Gmsh is not found. Cannot generate mesh")
 
-    import tempfile
-
-    geo, geo_name = tempfile.mkstemp(suffix=".geo", dir=_bempp.TMP_PATH, text=True)
-    geo_file = os.fdopen(geo, "w")
-    msh_name = os.path.splitext(geo_name)[0] + ".msh"
+    geo, geo_name = _tempfile.mkstemp(suffix=".geo", dir=_bempp.TMP_PATH, text=True)
+    geo_file = _os.fdopen(geo, "w")
+    msh_name = _os.path.splitext(geo_name)[0] + ".msh"
 
     geo_file.write(geo_string)
     geo_file.close()
 
-    fnull = open(os.devnull, "w")
-    cmd = gmsh_command + " -2 " + geo_name
+    cmd = [gmsh_command, "-2", geo_name]
     try:
-        subprocess.check_call(cmd, shell=True, stdout=fnull, stderr=fnull)
+        _subprocess.run(
+            cmd, check=True, stdout=_subprocess.DEVNULL, stderr=_subprocess.DEVNULL
+        )
     except:
-        print("The following command failed: " + cmd)
-        fnull.close()
+        print("The following command failed: " + " ".join(cmd))
         raise
-    os.remove(geo_name)
-    fnull.close()
+    _os.remove(geo_name)
     return msh_name
 
 
 def generate_grid_from_geo_string(geo_string):
     """Helper routine that implements the grid generation"""
 
-    import os
-
     msh_name = msh_from_string(geo_string)
     grid = _bempp.import_grid(msh_name)
-    os.remove(msh_name)
+    _os.remove(msh_name)
     return grid
 
 
@@ -379,9 +492,8 @@ def plane_grid(x_axis_lims, y_axis_lims, rotation_axis, rotation_angle, element_
     Rotate {{rot_ax1, rot_ax2, rot_ax3}, {0, 0, 0}, rot_ang_rad} { Surface{2}; }
     Mesh.Algorithm = 2;
     """
-    import sys
 
-    if sys.version_info.major >= 3 and sys.version_info.minor >= 6:
+    if _sys.version_info.major >= 3 and _sys.version_info.minor >= 6:
         return
     else:
         geometry = (
@@ -446,14 +558,15 @@ def create_grid_points(resolution, plane_axes, plane_offset, bounding_box, mode)
 
     ax1_min, ax1_max, ax2_min, ax2_max = bounding_box
     if mode.lower() == "numpy":
-        plot_grid = _np.mgrid[
-            ax1_min : ax1_max : resolution[0] * 1j,
-            ax2_min : ax2_max : resolution[1] * 1j,
-        ]
-        points_tmp = [_np.ones(plot_grid[0].size) * plane_offset] * 3
-        points_tmp[plane_axes[0]] = plot_grid[0].ravel()
-        points_tmp[plane_axes[1]] = plot_grid[1].ravel()
-        points = _np.vstack((points_tmp,))
+        axis1_values, axis2_values = _np.meshgrid(
+            _np.linspace(ax1_min, ax1_max, resolution[0]),
+            _np.linspace(ax2_min, ax2_max, resolution[1]),
+            indexing="ij",
+        )
+        points = _np.empty((3, axis1_values.size), dtype=float)
+        points[:] = plane_offset
+        points[plane_axes[0]] = axis1_values.ravel()
+        points[plane_axes[1]] = axis2_values.ravel()
         plane = None
 
     elif mode.lower() == "gmsh":